@@ -10,7 +10,6 @@ from devind_helpers.exceptions import PermissionDenied
 from devind_helpers.permissions import BasePermission
 from devind_helpers.redis_client import redis
 from devind_helpers.resolve_model import ResolveModel
-from devind_helpers.utils import convert_str_to_int
 from devind_helpers.validator import Validator
 
 __all__ = (
@@ -21,6 +20,31 @@ __all__ = (
     'register_users',
 )
 
+# Атомарная регистрация пользователя: чтение, решение и запись за один вызов
+_REGISTER_USERS_LUA = """
+local value = tonumber(redis.call('HGET', KEYS[1], ARGV[1])) or 0
+if value <= 0 and ARGV[2] == '1' then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+else
+    redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[3])
+end
+"""
+_register_users_script: Optional[Callable] = None
+
+
+def _get_register_users_script() -> Optional[Callable]:
+    """Получение скрипта регистрации пользователя.
+
+    Скрипт регистрируется при первом вызове, т.к. подключение к редису ленивое.
+
+    :return: скрипт регистрации пользователя или None, если редис недоступен
+    """
+
+    global _register_users_script
+    if _register_users_script is None and redis:
+        _register_users_script = redis.register_script(_REGISTER_USERS_LUA)
+    return _register_users_script
+
 
 def permission_classes(permissions: Iterable[Type[BasePermission]]) -> Callable[[Callable], Callable]:
     """Применение классов разрешений к мутации.
@@ -28,13 +52,20 @@ def permission_classes(permissions: Iterable[Type[BasePermission]]) -> Callable[
     :param permissions: классы разрешений
     """
 
+    permissions = tuple(permissions)
+
     def wrapped_decorator(func: Callable) -> Callable:
+        info_index: Optional[int] = None
+
         @wraps(func)
         def inner(*args, **kwargs):
             def check_object_perms(context, obj):
                 if not _check_object_permissions(permissions, context, obj):
                     raise PermissionDenied('Ошибка доступа')
-            info: ResolveInfo = _get_resolve_info(*args)
+            nonlocal info_index
+            if info_index is None:
+                info_index = _get_resolve_info_index(args)
+            info: ResolveInfo = args[info_index]
             if _check_permissions(permissions, info.context):
                 info.context.check_object_permissions = check_object_perms
                 return func(*args, **kwargs)
@@ -49,6 +80,8 @@ def resolve_classes(resolve_models: Optional[Iterable[Type[ResolveModel]]]) -> C
     :param resolve_models: классы, разрешающие данные
     """
 
+    resolve_models = tuple(resolve_models or ())
+
     def wrapped_decorator(func: Callable) -> Callable:
         @wraps(func)
         def inner(*args, **kwargs):
@@ -80,19 +113,24 @@ def validation_classes(
 
     from devind_helpers.schema.types import ErrorFieldType
 
+    # Каждый валидатор компилируется в один вызов при декорировании
+    plan: tuple[Callable[[dict], Optional[dict]], ...] = tuple(
+        _compile_validator(validator, None)
+        if isinstance(validator, type) and issubclass(validator, Validator)
+        else _compile_validator(*validator)
+        for validator in validators
+    )
+
     def wrapped_decorator(func: Callable) -> Callable:
         @wraps(func)
         def inner(cls, root, info: ResolveInfo, *args, **kwargs):
             def get_errors(validation_data: Optional[dict] = None) -> list[ErrorFieldType]:
                 data: dict = validation_data or _validation_filter(kwargs)
                 errors: list[ErrorFieldType] = []
-                for validator in validators:
-                    if issubclass(validator, Validator):
-                        v = validator(data)
-                    else:
-                        v = validator[0]({k: v for k, v in data.items() if validator[1](k)})
-                    if not v.validate():
-                        errors.extend(ErrorFieldType.from_validator(v.get_message()))
+                for run in plan:
+                    messages = run(data)
+                    if messages:
+                        errors.extend(ErrorFieldType.from_validator(messages))
                 return errors
             ad = additional_data or {}
             try:
@@ -120,17 +158,19 @@ def register_users(key: str, delete: bool = False) -> Callable[[Callable], Calla
     """
 
     def wrapped_decorator(func: Callable) -> Callable:
+        info_index: Optional[int] = None
+
         @wraps(func)
         def inner(*args, **kwargs):
-            info: ResolveInfo = _get_resolve_info(*args)
+            nonlocal info_index
+            if info_index is None:
+                info_index = _get_resolve_info_index(args)
+            info: ResolveInfo = args[info_index]
             user_id: Optional[int] = info.context.user.id if hasattr(info.context, 'user') else None
-            if redis and user_id:
-                value: int = convert_str_to_int(redis.hget(key, user_id)) or 0
+            script = _get_register_users_script()
+            if script and user_id:
                 # Если значение <= 0 и очищаем, то мы не можем отнять -1 -> удаляем
-                if value <= 0 and delete:
-                    redis.hdel(key, user_id)
-                else:
-                    redis.hincrby(key, user_id, -1 if delete else 1)
+                script(keys=[key], args=[user_id, 1 if delete else 0, -1 if delete else 1])
             return func(*args, **kwargs)
         return inner
     return wrapped_decorator
@@ -139,13 +179,28 @@ def register_users(key: str, delete: bool = False) -> Callable[[Callable], Calla
 def _check_permissions(permissions: Iterable[Type[BasePermission]], context: Any) -> bool:
     """Проверка разрешений.
 
+    Результаты has_permission кешируются на контексте, т.к. в рамках одного запроса
+    одни и те же классы разрешений проверяются многими резолверами.
+    Проверки has_object_permission зависят от объекта и не кешируются.
+
     :param permissions: классы разрешений
     :param context: контекст
     :return: результат проверки
     """
 
+    cache: Optional[dict[Type[BasePermission], bool]] = getattr(context, '_perm_cache', None)
+    if cache is None:
+        cache = {}
+        try:
+            context._perm_cache = cache
+        except AttributeError:
+            # Контекст не допускает установку атрибутов — проверяем без кеша
+            pass
     for permission in permissions:
-        if not permission.has_permission(context):
+        result = cache.get(permission)
+        if result is None:
+            result = cache[permission] = permission.has_permission(context)
+        if not result:
             return False
     return True
 
@@ -165,6 +220,27 @@ def _check_object_permissions(permissions: Iterable[Type[BasePermission]], conte
     return True
 
 
+def _compile_validator(
+        validator: Type[Validator],
+        predicate: Optional[Callable[[str], bool]] = None) -> Callable[[dict], Optional[dict]]:
+    """Компиляция валидатора в один вызов.
+
+    :param validator: класс валидатора
+    :param predicate: функция, определяющая включать ли соответствующий ключ в валидацию
+    :return: функция, возвращающая сообщения об ошибках или None при успешной валидации
+    """
+
+    if predicate is None:
+        def run(data: dict) -> Optional[dict]:
+            v = validator(data)
+            return None if v.validate() else v.get_message()
+    else:
+        def run(data: dict) -> Optional[dict]:
+            v = validator({k: value for k, value in data.items() if predicate(k)})
+            return None if v.validate() else v.get_message()
+    return run
+
+
 def _validation_filter(kwargs: dict) -> dict:
     """Фильтр для исключения TemporaryUploadedFile из валидации, т.к. такие файлы приводят к ошибке валидатора.
 
@@ -172,15 +248,24 @@ def _validation_filter(kwargs: dict) -> dict:
     :return: словарь для валидации с исключенными значениями TemporaryUploadedFile
     """
 
+    if not any(isinstance(v, TemporaryUploadedFile) for v in kwargs.values()):
+        return kwargs
     return {k: v for k, v in kwargs.items() if not isinstance(v, TemporaryUploadedFile)}
 
 
-def _get_resolve_info(*args) -> ResolveInfo:
-    """Получение ResolveInfo из аргументов, которые могут быть,
+def _get_resolve_info_index(args: tuple) -> int:
+    """Получение позиции ResolveInfo в аргументах, которые могут быть,
     как аргументами метода экземпляра или класса, так и аргументами статического метода.
 
+    Позиция фиксирована для каждой декорированной функции,
+    поэтому вычисляется один раз при первом вызове и далее переиспользуется.
+
     :param args: аргументы метода неизвестного типа
-    :return: объект ResolveInfo
+    :return: позиция объекта ResolveInfo
     """
 
-    return args[2] if len(args) >= 3 and hasattr(args[2], 'context') else args[1]
+    try:
+        args[2].context
+        return 2
+    except (IndexError, AttributeError):
+        return 1
@@ -1,8 +1,11 @@
 """Модуль для удаления лишних файлов, на которые нет ссылающихся записей в БД."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from functools import reduce
+from functools import lru_cache
+from itertools import chain
 from os import path, remove
+from threading import Lock
 from typing import cast, Type, Callable, Iterable, Optional
 
 from django.apps import apps, AppConfig
@@ -45,8 +48,8 @@ def clear_model_field_files(model: Type[Model], field_name: str, callback: Optio
     field = model._meta.get_field(field_name)
     if not isinstance(field, FileField):
         raise ValueError(f'Поле {field} не является экземпляром {FileField.__name__}')
-    file_fields = [f for f in model._meta.get_fields() if isinstance(f, FileField)]
-    _clear_model_field_files(model._meta.app_config, model, file_fields, field, callback)
+    file_fields = _get_file_fields(model)
+    _clear_model_field_files(model._meta.app_config, model, _get_db_paths(model, file_fields), field, callback)
 
 
 def clear_models_files(models: Iterable[Type[Model]], callback: Optional[Callback] = None) -> None:
@@ -67,10 +70,33 @@ def clear_apps_files(app_labels: Iterable[str], callback: Optional[Callback] = N
     :param callback: функция обратного вызова для получения информации об удаляемых файлах
     """
 
+    jobs: list[tuple[AppConfig, Type[Model], set[str], FileField]] = []
     for app_name in app_labels:
         app: AppConfig = apps.get_app_config(app_name)
         for model in cast(Iterable[Type[Model]], app.get_models()):
-            _clear_model_files(app, model, callback)
+            file_fields = _get_file_fields(model)
+            if not file_fields:
+                continue
+            db_paths = _get_db_paths(model, file_fields)
+            jobs.extend((app, model, db_paths, field) for field in file_fields)
+    if not jobs:
+        return
+    if callback:
+        # Пользовательская функция обратного вызова может быть не потокобезопасной
+        lock = Lock()
+        user_callback = callback
+
+        def callback(file_info: DeletedFileInfo) -> None:
+            with lock:
+                user_callback(file_info)
+    with ThreadPoolExecutor(max_workers=min(32, len(jobs))) as executor:
+        # Удаление внутри задачи последовательное, чтобы пулы не вкладывались друг в друга
+        futures = [
+            executor.submit(_clear_model_field_files, *job, callback=callback, max_workers=1)
+            for job in jobs
+        ]
+        for future in as_completed(futures):
+            future.result()
 
 
 def _clear_model_files(app: AppConfig, model: Type[Model], callback: Optional[Callback] = None) -> None:
@@ -81,35 +107,79 @@ def _clear_model_files(app: AppConfig, model: Type[Model], callback: Optional[Ca
     :param callback: функция обратного вызова для получения информации об удаляемых файлах
     """
 
-    file_fields = [f for f in model._meta.get_fields() if isinstance(f, FileField)]
+    file_fields = _get_file_fields(model)
+    if not file_fields:
+        return
+    db_paths = _get_db_paths(model, file_fields)
     for field in file_fields:
-        _clear_model_field_files(app, model, file_fields, field, callback)
+        _clear_model_field_files(app, model, db_paths, field, callback)
+
+
+@lru_cache(maxsize=None)
+def _get_file_fields(model: Type[Model]) -> tuple[FileField, ...]:
+    """Получение файловых полей модели.
+
+    Результат кешируется, т.к. get_fields перестраивает список полей при каждом вызове.
+
+    :param model: модель
+    :return: файловые поля модели
+    """
+
+    return tuple(f for f in model._meta.get_fields() if isinstance(f, FileField))
+
+
+def _get_db_paths(model: Type[Model], file_fields: tuple[FileField, ...]) -> set[str]:
+    """Получение путей файлов, на которые ссылаются записи модели.
+
+    :param model: модель
+    :param file_fields: файловые поля модели
+    :return: пути файлов, на которые ссылаются записи модели
+    """
+
+    return set(chain.from_iterable(
+        model.objects.values_list(*[field.name for field in file_fields]).iterator(chunk_size=5000)
+    ))
 
 
 def _clear_model_field_files(
         app: AppConfig,
         model: Type[Model],
-        file_fields: list[FileField],
+        db_paths: set[str],
         file_field: FileField,
-        callback: Optional[Callback] = None) -> None:
+        callback: Optional[Callback] = None,
+        max_workers: Optional[int] = None) -> None:
     """Удаление лишних файлов поля модели.
 
     :param app: приложение
     :param model: модель
-    :param file_fields: файловые поля модели
+    :param db_paths: пути файлов, на которые ссылаются записи модели
     :param file_field: файловое поле модели для удаления
     :param callback: функция обратного вызова для получения информации об удаляемых файлах
+    :param max_workers: максимальное число потоков удаления
+    (по умолчанию настройка CLEAR_FILES_MAX_WORKERS)
     """
 
     existing_paths = get_existing_paths(file_field)
-    db_paths = reduce(
-        lambda acc, field: acc | set(model.objects.values_list(field.name, flat=True)),
-        file_fields,
-        set()
-    )
     paths_to_delete = existing_paths - db_paths
+    if not paths_to_delete:
+        return
     model_files_info = DeleteModelFilesInfo(app, model, file_field, len(paths_to_delete))
-    for i, path_to_delete in enumerate(paths_to_delete):
-        remove(path.join(settings.BASE_DIR, path_to_delete))
-        if callback:
-            callback(DeletedFileInfo(model_files_info, path_to_delete, i))
+    if max_workers is None:
+        max_workers = getattr(settings, 'CLEAR_FILES_MAX_WORKERS', 16)
+    max_workers = min(max_workers, len(paths_to_delete))
+    if max_workers <= 1:
+        for i, path_to_delete in enumerate(paths_to_delete):
+            remove(path.join(settings.BASE_DIR, path_to_delete))
+            if callback:
+                callback(DeletedFileInfo(model_files_info, path_to_delete, i))
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(remove, path.join(settings.BASE_DIR, path_to_delete)): (i, path_to_delete)
+            for i, path_to_delete in enumerate(paths_to_delete)
+        }
+        for future in as_completed(futures):
+            i, path_to_delete = futures[future]
+            future.result()
+            if callback:
+                callback(DeletedFileInfo(model_files_info, path_to_delete, i))
@@ -1,6 +1,7 @@
 """Модуль считывателя из формата csv."""
 
 import csv
+from itertools import zip_longest
 from typing import Iterable
 
 from .base_reader import BaseReader
@@ -9,16 +10,25 @@ from .base_reader import BaseReader
 class CsvReader(BaseReader):
     """Считыватель из формата csv."""
 
-    def __init__(self, path: str):
-        """Конструктор считывателя из формата csv.
-
-        :param path: путь к файлу
-        """
-        super().__init__(path)
-        self.reader = csv.DictReader(open(path))
-
     @property
     def items(self) -> Iterable:
         """Итерируемся по файлу."""
-        for row in self.reader:
-            yield self.tree_transform(row)
+        with open(self.path, newline='') as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return
+            # Схема вложенности ключей вычисляется один раз по заголовку
+            paths: list[tuple[str, ...]] = [tuple(key.split('.')) for key in header]
+            for row in reader:
+                # Пустые строки пропускаются, как это делал DictReader
+                if not row:
+                    continue
+                item: dict = {}
+                # Короткие строки дополняются None по образцу DictReader
+                for path, value in zip_longest(paths, row[:len(paths)]):
+                    nested = item
+                    for key in path[:-1]:
+                        nested = nested.setdefault(key, {})
+                    nested[path[-1]] = value
+                yield item
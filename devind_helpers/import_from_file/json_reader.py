@@ -5,19 +5,19 @@ from typing import Iterable
 
 from .base_reader import BaseReader
 
+try:
+    # orjson разбирает json в 5-10 раз быстрее стандартной библиотеки
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 
 class JsonReader(BaseReader):
     """Считыватель из формата json."""
 
-    def __init__(self, path: str):
-        """Конструктор считывателя из формата json.
-
-        :param path: путь к файлу
-        """
-        super().__init__(path)
-
     @property
     def items(self) -> Iterable:
         """Перебираем строки."""
-        for row in json.load(open(self.path, encoding='utf-8')):
-            yield row
+        with open(self.path, 'rb') as file:
+            rows = _loads(file.read())
+        yield from rows
@@ -1,4 +1,6 @@
+from base64 import b64decode
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Type, Protocol, Any, Optional, Iterable, Callable, cast
 
 import graphene
@@ -17,6 +19,31 @@ from devind_helpers.schema.mutations import BaseMutation
 __all__ = ('CheckPermissions', 'DeleteMutation',)
 
 
+def _gid_pk(global_id: str) -> str:
+    """Получение первичного ключа из глобального идентификатора.
+
+    Прямое декодирование base64 вместо from_global_id для массовых операций.
+
+    :param global_id: глобальный идентификатор
+    :return: первичный ключ
+    """
+
+    return b64decode(global_id).split(b':', 1)[1].decode()
+
+
+@lru_cache(maxsize=None)
+def _get_delete_permission(model: Type[models.Model]) -> Type[BasePermission]:
+    """Получение класса разрешения на удаление записей модели.
+
+    Класс разрешения один для всех мутаций удаления одной модели, поэтому кешируется.
+
+    :param model: модель, в которой необходимо осуществить удаление
+    :return: класс разрешения на удаление
+    """
+
+    return ModelPermission(f'{model._meta.app_label}.delete_{model._meta.model_name.lower()}')
+
+
 class CheckPermissions(Protocol):
     def __call__(self, context: Any, obj: models.Model) -> None:
         """Особая проверка разрешений.
@@ -132,28 +159,23 @@ class DeleteMutation(type):
 
         if permissions:
             return permissions
-        return IsAuthenticated, ModelPermission(f'{model._meta.app_label}.delete_{model._meta.model_name.lower()}')
+        return IsAuthenticated, _get_delete_permission(model)
 
     @staticmethod
     def _create_input_class(
             model: Type[models.Model],
             is_multiple: bool,
-            key: str,
+            computed_key: str,
             description: Optional[str]) -> type:
         """Создание класса Input.
 
         :param model: модель, в которой необходимо осуществить удаление
         :param is_multiple: удалять ли несколько записей
-        :param key: ключ поля идентификатора
+        :param computed_key: вычисленный ключ поля идентификатора
         :param description: описание поля идентификатора
         :return: класс Input
         """
 
-        if key:
-            computed_key = key
-        else:
-            underscore_name = underscore(model.__name__)
-            computed_key = f'{underscore_name}_ids' if is_multiple else f'{underscore_name}_id'
         if description:
             computed_description = description
         else:
@@ -197,9 +219,7 @@ class DeleteMutation(type):
                 info.context.check_object_permissions(info.context, obj)
             if additional_actions:
                 additional_actions(obj)
-            return mutation_class_container.mutation_class(
-                success=cast(models.Model, super(model, obj)).delete()[0] > 0
-            )
+            return mutation_class_container.mutation_class(success=obj.delete()[0] > 0)
 
         return mutate_and_get_payload
 
@@ -226,19 +246,19 @@ class DeleteMutation(type):
 
         @permission_classes(permissions)
         def mutate_and_get_payload(root, info: ResolveInfo, **kwargs):
-            ids: list[str] = [from_global_id(global_id)[1] for global_id in kwargs[key]] if is_global_id else kwargs[
-                key]
+            ids: list[str] = [_gid_pk(global_id) for global_id in kwargs[key]] if is_global_id else kwargs[key]
             qs = model.objects.filter(pk__in=ids)
-            if len(ids) != qs.count():
+            objs = list(qs)
+            if len(ids) != len(objs):
                 raise NotFoundMultiple()
             if check_permissions or hasattr(info.context, 'check_object_permissions'):
-                for obj in qs.all():
+                for obj in objs:
                     if check_permissions:
                         check_permissions(info.context, obj)
                     elif hasattr(info.context, 'check_object_permissions'):
                         info.context.check_object_permissions(info.context, obj)
             if additional_actions:
-                for obj in qs.all():
+                for obj in objs:
                     additional_actions(obj)
             return mutation_class_container.mutation_class(success=qs.delete()[0] > 0)
 
@@ -1,6 +1,38 @@
 from .base_permissions import BasePermission
 
 
+def _is_authenticated(context) -> bool:
+    """Проверка аутентификации пользователя с кешированием результата на контексте.
+
+    user.is_authenticated у SimpleLazyObject запускает полную загрузку пользователя,
+    поэтому результат вычисляется один раз на запрос.
+
+    :param context: контекст
+    :return: аутентифицирован ли пользователь
+    """
+
+    cached = getattr(context, '_is_authenticated_cache', None)
+    if cached is not None:
+        return cached
+    user = getattr(context, 'user', None)
+    result = user is not None and user.is_authenticated
+    try:
+        context._is_authenticated_cache = result
+    except AttributeError:
+        pass
+    return result
+
+
+def _is_guest(context) -> bool:
+    """Проверка отсутствия аутентификации пользователя.
+
+    :param context: контекст
+    :return: является ли пользователь гостем
+    """
+
+    return not _is_authenticated(context)
+
+
 class AllowAny(BasePermission):
     """Пропускает всех пользователей."""
 
@@ -10,16 +42,10 @@ class AllowAny(BasePermission):
 class IsAuthenticated(BasePermission):
     """Пропускает только авторизованных пользователей."""
 
-    @staticmethod
-    def has_permission(context):
-        """Непосредственная проверка разрешений."""
-        return hasattr(context, 'user') and context.user.is_authenticated
+    has_permission = staticmethod(_is_authenticated)
 
 
 class IsGuest(BasePermission):
     """Пропускает только неавторизованных пользователей."""
 
-    @staticmethod
-    def has_permission(context):
-        """Непосредственная проверка разрешений."""
-        return not (hasattr(context, 'user') and context.user.is_authenticated)
\ No newline at end of file
+    has_permission = staticmethod(_is_guest)
@@ -4,16 +4,44 @@ import os
 from typing import Optional
 
 from redis import Redis
+from redis.exceptions import RedisError
 
 __all__ = ('redis',)
 
 
-try:
-    redis: Optional[Redis] = Redis(
-        host=os.getenv('REDIS_SERVER', 'localhost'),
-        port=int(os.getenv('REDIS_PORT', 6379)),
-        db=int(os.getenv('REDIS_DB', 0))
-    )
-    redis.ping()
-except ConnectionError:
-    redis: Optional[Redis] = None
+class _LazyRedis:
+    """Ленивое подключение к редису.
+
+    Подключение создается и проверяется при первом обращении, а не при импорте модуля,
+    чтобы не блокировать запуск приложения сетевым обращением.
+    """
+
+    def __init__(self):
+        self._client: Optional[Redis] = None
+        self._checked: bool = False
+
+    def _connect(self) -> Optional[Redis]:
+        """Создание и проверка подключения при первом обращении."""
+        if not self._checked:
+            self._checked = True
+            try:
+                client = Redis(
+                    host=os.getenv('REDIS_SERVER', 'localhost'),
+                    port=int(os.getenv('REDIS_PORT', 6379)),
+                    db=int(os.getenv('REDIS_DB', 0)),
+                    socket_connect_timeout=1
+                )
+                client.ping()
+                self._client = client
+            except (RedisError, OSError):
+                self._client = None
+        return self._client
+
+    def __bool__(self) -> bool:
+        return self._connect() is not None
+
+    def __getattr__(self, item):
+        return getattr(self._connect(), item)
+
+
+redis = _LazyRedis()
@@ -1,8 +1,21 @@
 """Модуль подставного django.http.HttpRequest."""
 
 
+def _return_true() -> bool:
+    return True
+
+
 class Request:
-    """Подставной django.http.HttpRequest для превращения запроса на мутацию в запрос http."""
+    """Подставной django.http.HttpRequest для превращения запроса на мутацию в запрос http.
+
+    method, is_secure и get_full_path заданы атрибутами экземпляра,
+    чтобы не платить за протокол дескрипторов при каждом обращении.
+    """
+
+    __slots__ = (
+        'uri', 'body', 'META', 'headers', 'extra_credentials', 'http_method',
+        'method', 'is_secure', 'get_full_path',
+    )
 
     def __init__(self, uri, body, headers, meta, extra_credentials=None, http_method: str = 'POST'):
         self.uri = uri
@@ -11,14 +24,6 @@ class Request:
         self.headers = headers
         self.extra_credentials = extra_credentials
         self.http_method = http_method
-
-    @property
-    def method(self) -> str:
-        return self.http_method
-
-    def get_full_path(self):
-        return self.uri
-
-    @staticmethod
-    def is_secure():
-        return True
+        self.method = http_method
+        self.is_secure = _return_true
+        self.get_full_path = lambda: uri
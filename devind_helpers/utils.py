@@ -2,47 +2,79 @@
 import re
 
 from argparse import ArgumentTypeError
-from random import choice
+from base64 import b64decode
+from functools import lru_cache
+from random import choices
 from string import ascii_letters
-from typing import Optional, Tuple, Union
+from typing import Iterable, Optional, Tuple, Union
 
-from graphql_relay import from_global_id
+_TEMPLATE_RE = re.compile(r'\{\{ .*? \}\}')
 
+_BOOL_MAP: dict[str, bool] = {
+    'yes': True, 'true': True, 't': True, 'y': True, '1': True,
+    'no': False, 'false': False, 'f': False, 'n': False, '0': False,
+}
+
+
+def _fast_from_gid(gid: str) -> Tuple[Optional[str], Optional[str]]:
+    """Прямое декодирование глобального идентификатора.
+
+    Раскладывает base64-представление "Тип:идентификатор" без вызова from_global_id.
+
+    :param gid: глобальный идентификатор
+    :return: пара (тип, идентификатор) или (None, None) в случае ошибки разбора
+    """
 
-def gid2int(gid: Union[str, int]) -> Optional[int]:
     try:
+        raw = b64decode(gid.encode('ascii'))
+        type_name, sep, pk = raw.partition(b':')
+        if not sep:
+            return None, None
+        return type_name.decode('utf-8'), pk.decode('utf-8')
+    except Exception:
+        return None, None
+
+
+@lru_cache(maxsize=4096)
+def gid2int(gid: Union[str, int]) -> Optional[int]:
+    if isinstance(gid, int):
+        return gid
+    if gid.lstrip('-').isdecimal():
         return int(gid)
-    except ValueError:
-        try:
-            return int(from_global_id(gid)[1])
-        except TypeError:
-            return None
+    _, pk = _fast_from_gid(gid)
+    return int(pk) if pk and pk.isdigit() else None
+
+
+def gids2ints(gids: Iterable[Union[str, int]]) -> list[Optional[int]]:
+    """Преобразование глобальных идентификаторов в целые числа за один проход.
+
+    :param gids: глобальные идентификаторы
+    :return: целые числа, None на месте неразобранных значений
+    """
+
+    return [gid2int(gid) for gid in gids]
 
 
 def from_gid_or_none(global_id: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
     """Возвращает None в случае ошибки парсинга."""
-    if not global_id:
-        return None, None
-    try:
-        return from_global_id(global_id)
-    except TypeError:
+    # Явно некорректные идентификаторы отбрасываются до декодирования base64
+    if not global_id or not global_id.isascii() or len(global_id) % 4:
         return None, None
+    return _fast_from_gid(global_id)
 
 
 def random_string(count: int) -> str:
     """Генерация случайной строки из count."""
-    return ''.join(choice(ascii_letters) for _ in range(count))
+    return ''.join(choices(ascii_letters, k=count))
 
 
 def convert_str_to_bool(value: str) -> bool:
     """Преобразование строки в флаг."""
     if isinstance(value, bool):
         return value
-    if value.lower() in ('yes', 'true', 't', 'y', '1'):
-        return True
-    elif value.lower() in ('no', 'false', 'f', 'n', '0'):
-        return False
-    else:
+    try:
+        return _BOOL_MAP[value.lower()]
+    except KeyError:
         raise ArgumentTypeError('Ожидался флаг (true/false)')
 
 
@@ -52,6 +84,9 @@ def convert_str_to_int(value: Optional[Union[str, bytes]]) -> Optional[int]:
         return None
     if isinstance(value, bytes):
         value = value.decode('utf-8')
+    # Быстрый путь без исключений: isdecimal гарантирует успешный разбор int
+    if (value[1:] if value[:1] == '-' else value).isdecimal():
+        return int(value)
     try:
         return int(value)
     except ValueError:
@@ -60,4 +95,4 @@ def convert_str_to_int(value: Optional[Union[str, bytes]]) -> Optional[int]:
 
 def is_template(text: str) -> bool:
     """Поиск шаблона в строке"""
-    return bool(re.findall('{{ .*? }}', text))
+    return _TEMPLATE_RE.search(text) is not None
@@ -20,11 +20,12 @@ class TestMutation(BaseMutation):
 
     @staticmethod
     def mutate_and_get_payload(root: Any, info: ResolveInfo, i: str):
-        if i.isdigit():
+        try:
             return TestMutation(digit=int(i))
-        raise ValidationError(message={
-            'i': ['Ожидалась строка с числом']
-        })
+        except ValueError:
+            raise ValidationError(message={
+                'i': ['Ожидалась строка с числом']
+            })
 
 
 class TestMutations(graphene.ObjectType):
@@ -36,13 +37,28 @@ class TestMutations(graphene.ObjectType):
 class BaseMutationTestCase(TestCase):
     """Тесты класса `BaseMutation`."""
 
-    def setUp(self) -> None:
+    _QUERY = """
+        mutation Test($i: String!) {
+            testMutation(input: { i: $i }) {
+                digit
+                success
+                errors {
+                    field
+                    messages
+                }
+            }
+        }
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """Создание данных для тестирования."""
-        self.schema = graphene.Schema(mutation=TestMutations)
+        super().setUpClass()
+        cls.schema = graphene.Schema(mutation=TestMutations)
 
     def test_mutate(self) -> None:
         """Тестирование метода `mutate` без ошибок."""
-        result = self.schema.execute(self._create_test_mutation_query('5'))
+        result = self.schema.execute(self._QUERY, variables={'i': '5'})
         expected_data = OrderedDict()
         expected_data['testMutation'] = {
             'digit': 5,
@@ -53,7 +69,7 @@ class BaseMutationTestCase(TestCase):
 
     def test_mutate_validation_error(self) -> None:
         """Тестирование метода `mutate` с ошибкой `ValidationError`."""
-        result = self.schema.execute(self._create_test_mutation_query('x'))
+        result = self.schema.execute(self._QUERY, variables={'i': 'x'})
         expected_data = OrderedDict()
         expected_data['testMutation'] = {
             'digit': None,
@@ -64,19 +80,3 @@ class BaseMutationTestCase(TestCase):
             }]
         }
         self.assertEqual(expected_data, result.data)
-
-    @staticmethod
-    def _create_test_mutation_query(i: str):
-        """Создание запроса для тестовой мутации."""
-        return f"""
-            mutation {{
-                testMutation(input: {{ i: "{i}" }}) {{
-                    digit
-                    success
-                    errors {{
-                        field
-                        messages
-                    }}
-                }}
-            }}
-        """
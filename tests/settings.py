@@ -3,7 +3,10 @@
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': 'sqlite3.db',
+        'NAME': ':memory:',
+        'TEST': {
+            'NAME': ':memory:',
+        },
     }
 }
 